@@ -1,20 +1,217 @@
-from typing import Optional
-from urllib.parse import quote
-from .rest_client import RestClient
-from .models import Breach, BreachName, Paste, SubscribedDomain
+import json
+import time
+from typing import Any, Optional
+from urllib.parse import quote, urlencode
+from pydantic import BaseModel, TypeAdapter
+from .rest_client import RestClient, _json_loads
+from .models import (
+    Breach,
+    BreachName,
+    Paste,
+    SubscribedDomain,
+    _CONSTRUCTORS,
+    _RAW_STRUCTS,
+    _construct_from_raw,
+    msgspec,
+)
+
+# List validators are built once at import; validate_json loops over the array
+# inside pydantic-core instead of calling model_validate once per item
+_BREACH_LIST = TypeAdapter(list[Breach])
+_BREACH_NAME_LIST = TypeAdapter(list[BreachName])
+_PASTE_LIST = TypeAdapter(list[Paste])
+_SUBDOM_LIST = TypeAdapter(list[SubscribedDomain])
+
+_LIST_ADAPTERS: dict[type[BaseModel], TypeAdapter] = {
+    Breach: _BREACH_LIST,
+    BreachName: _BREACH_NAME_LIST,
+    Paste: _PASTE_LIST,
+    SubscribedDomain: _SUBDOM_LIST,
+}
+
+
+def _parse_models(content: bytes, model: type[BaseModel], validate: bool) -> list[BaseModel]:
+    """Build a list of `model` from a JSON array body, mirroring the API client parse paths."""
+    if validate:
+        return _LIST_ADAPTERS[model].validate_json(content)
+    
+    raw_type = _RAW_STRUCTS.get(model)
+    if raw_type is not None:
+        return [_construct_from_raw(model, raw) for raw in msgspec.json.decode(content, type=list[raw_type])]
+    
+    return list(map(_CONSTRUCTORS[model], _json_loads(content)))
+
+
+def _parse_range_response(body: bytes) -> dict[str, int]:
+    """Parse a Pwned Passwords range response into a hash suffix -> count map."""
+    counts = {}
+    for line in body.decode('ascii').splitlines():
+        suffix, _, count = line.partition(':')
+        if suffix:
+            counts[suffix] = int(count)
+    return counts
+
+
+class _RangeCache:
+    """ETag cache of Pwned Passwords range lookups shared by both API clients."""
+    
+    def __init__(self):
+        # Hash prefix -> (ETag, suffix counts)
+        self.entries: dict[str, tuple[str, dict[str, int]]] = {}
+    
+    def request_headers(self, hash_prefix: str) -> dict[str, str] | None:
+        """Return If-None-Match headers for a previously seen prefix, else None."""
+        cached = self.entries.get(hash_prefix)
+        return {"If-None-Match": cached[0]} if cached else None
+    
+    def update(self, hash_prefix: str, response: Any) -> dict[str, int]:
+        """Return the suffix counts for a range response, reusing the cached ones on 304."""
+        cached = self.entries.get(hash_prefix)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        
+        counts = _parse_range_response(response.content)
+        etag = response.headers.get("etag")
+        if etag:
+            self.entries[hash_prefix] = (etag, counts)
+        return counts
+
+
+def _load_breach_cache(path: str) -> dict[str, Any] | None:
+    """Load a persisted /breaches response, or None if there is no usable cache file."""
+    try:
+        with open(path, 'rb') as f:
+            entry = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    
+    # Anything but the shape written by _save_breach_cache is treated as no cache
+    if (
+        not isinstance(entry, dict)
+        or not isinstance(entry.get("body"), str)
+        or not isinstance(entry.get("fetched_at"), (int, float))
+        or not isinstance(entry.get("etag"), (str, type(None)))
+        or not isinstance(entry.get("last_modified"), (str, type(None)))
+    ):
+        return None
+    return entry
+
+
+def _save_breach_cache(path: str, entry: dict[str, Any]):
+    """Persist a /breaches response with its ETag / Last-Modified validators as JSON."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(entry))
+
+
+# Minimum age of the catalogue before a name missing from it triggers a refresh,
+# so repeated lookups of an unknown name do not re-request /breaches every time
+_MISSING_NAME_REFRESH_AGE = 60.0
+
+
+class _BreachCatalogue:
+    """
+    In-memory and on-disk cache of the /breaches catalogue shared by both API clients.
+    
+    A refresh is split around the HTTP call so the sync and async clients only
+    differ in how they fetch: fresh_index() serves the in-memory copy,
+    revalidation() picks the newest cached response (in memory or on disk) and
+    builds the conditional request headers, and update() folds in the response
+    (200 or 304) and rebuilds the index.
+    """
+    
+    def __init__(self, path: Optional[str], validate: bool):
+        self.path = path
+        self.validate = validate
+        self.index: dict[str, Breach] | None = None
+        self.fetched_at = 0.0
+        # Last /breaches response (body and validators), kept so refreshes are
+        # conditional even without a cache file
+        self.entry: dict[str, Any] | None = None
+    
+    def fresh_index(self, ttl: float) -> dict[str, Breach] | None:
+        """Return the in-memory index if it is younger than `ttl` seconds."""
+        if self.index is not None and time.time() - self.fetched_at < ttl:
+            return self.index
+        return None
+    
+    def revalidation(self, ttl: float) -> tuple[dict[str, Any] | None, dict[str, str] | None]:
+        """
+        Find the newest cached response and decide whether /breaches must be requested.
+        
+        Returns:
+            The cached entry (or None) and the request headers to fetch with,
+            or None for the headers if the disk copy is still fresh
+        """
+        candidates = [self.entry, _load_breach_cache(self.path) if self.path else None]
+        cached = max(filter(None, candidates), key=lambda entry: entry["fetched_at"], default=None)
+        if cached is not None and time.time() - cached["fetched_at"] < ttl:
+            return cached, None
+        
+        headers = {}
+        if cached is not None:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+        return cached, headers
+    
+    def update(self, cached: dict[str, Any] | None, response: Any = None) -> dict[str, Breach]:
+        """
+        Fold a /breaches response into the cache and rebuild the index.
+        
+        Args:
+            cached: Entry returned by revalidation()
+            response: The /breaches response, or None if the cached copy was fresh
+        
+        Returns:
+            Dict mapping breach name to Breach
+        """
+        if response is not None:
+            # 304 Not Modified keeps the stored body and just restarts its TTL
+            if response.status_code != 304 or cached is None:
+                cached = {
+                    "etag": response.headers.get("etag"),
+                    "last_modified": response.headers.get("last-modified"),
+                    "body": response.content.decode('utf-8'),
+                }
+            cached["fetched_at"] = time.time()
+            if self.path:
+                _save_breach_cache(self.path, cached)
+        
+        # Only re-parse when the body differs from the one the index was built from
+        if self.index is None or self.entry is None or cached["body"] != self.entry["body"]:
+            breaches = _parse_models(cached["body"].encode('utf-8'), Breach, self.validate)
+            self.index = {breach.name: breach for breach in breaches}
+        self.entry = cached
+        self.fetched_at = cached["fetched_at"]
+        return self.index
 
 
 class ApiClient:
     """Have I Been Pwned API client wrapper."""
     
-    def __init__(self, api_key: Optional[str] = None, user_agent: str = "hibp-client"):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        user_agent: str = "hibp-client",
+        validate: bool = False,
+        breach_cache_path: Optional[str] = None
+    ):
         """
         Initialize the API client.
         
         Args:
             api_key: Optional API key for authenticated endpoints
             user_agent: User agent string for requests
+            validate: Run full Pydantic validation on responses instead of
+                trusting the API schema and building models directly
+            breach_cache_path: Optional file used to persist the /breaches
+                catalogue between runs (revalidated with conditional GETs)
         """
+        self.validate = validate
+        self.breach_cache_path = breach_cache_path
+        self._breach_catalogue = _BreachCatalogue(breach_cache_path, validate)
+        self._range_cache = _RangeCache()
         self.client = RestClient(
             base_url="https://haveibeenpwned.com/api/v3",
             api_key=api_key,
@@ -25,6 +222,47 @@ class ApiClient:
             user_agent=user_agent
         )
     
+    def close(self):
+        """Close both underlying REST client sessions."""
+        self.client.close()
+        self.pwned_passwords_client.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _get_one(self, endpoint: str, model: type[BaseModel]) -> BaseModel | None:
+        """Fetch a JSON object and build `model` from it."""
+        if self.validate:
+            return self.client.get(endpoint, as_model=model)
+        
+        raw_type = _RAW_STRUCTS.get(model)
+        if raw_type is not None:
+            raw = self.client.get_decoded(endpoint, raw_type)
+            return None if raw is None else _construct_from_raw(model, raw)
+        
+        result = self.client.get(endpoint)
+        if result is None:
+            return None
+        return _CONSTRUCTORS[model](result)
+    
+    def _get_many(self, endpoint: str, model: type[BaseModel]) -> list[BaseModel] | None:
+        """Fetch a JSON array and build a list of `model` from it."""
+        if self.validate:
+            return self.client.get(endpoint, adapter=_LIST_ADAPTERS[model])
+        
+        raw_type = _RAW_STRUCTS.get(model)
+        if raw_type is not None:
+            raws = self.client.get_decoded(endpoint, list[raw_type])
+            return None if raws is None else [_construct_from_raw(model, raw) for raw in raws]
+        
+        result = self.client.get(endpoint)
+        if result is None:
+            return None
+        return list(map(_CONSTRUCTORS[model], result))
+    
     # Breach Endpoints
     
     def get_breaches_for_account(
@@ -36,26 +274,18 @@ class ApiClient:
     ) -> list[BreachName | Breach] | None:
         """Get breaches for an account."""
         endpoint = f"/breachedaccount/{quote(account)}"
-        params = []
-        
-        if not truncate_response:
-            params.append("truncateResponse=false")
-        if domain:
-            params.append(f"domain={domain}")
-        if not include_unverified:
-            params.append("includeUnverified=false")
+        params = {
+            "truncateResponse": None if truncate_response else "false",
+            "domain": domain or None,
+            "includeUnverified": None if include_unverified else "false",
+        }
         
-        if params:
-            endpoint += "?" + "&".join(params)
+        query = urlencode({key: value for key, value in params.items() if value is not None})
+        if query:
+            endpoint += "?" + query
         
-        result = self.client.get(endpoint)
-        if result is None:
-            return None
-        
-        if truncate_response:
-            return [BreachName.model_validate(item) for item in result]
-        else:
-            return [Breach.model_validate(item) for item in result]
+        model = BreachName if truncate_response else Breach
+        return self._get_many(endpoint, model)
     
     def get_breached_domain(self, domain: str) -> dict[str, list[str]] | None:
         """Get breached accounts for a domain."""
@@ -64,10 +294,7 @@ class ApiClient:
     
     def get_subscribed_domains(self) -> list[SubscribedDomain] | None:
         """Get subscribed domains."""
-        result = self.client.get("/subscribeddomains")
-        if result is None:
-            return None
-        return [SubscribedDomain.model_validate(item) for item in result]
+        return self._get_many("/subscribeddomains", SubscribedDomain)
     
     def get_all_breaches(
         self,
@@ -76,39 +303,71 @@ class ApiClient:
     ) -> list[Breach] | None:
         """Get all breaches."""
         endpoint = "/breaches"
-        params = []
-        
-        if domain:
-            params.append(f"Domain={domain}")
-        if is_spam_list is not None:
-            params.append(f"IsSpamList={'true' if is_spam_list else 'false'}")
+        params = {
+            "Domain": domain or None,
+            "IsSpamList": None if is_spam_list is None else ("true" if is_spam_list else "false"),
+        }
         
-        if params:
-            endpoint += "?" + "&".join(params)
+        query = urlencode({key: value for key, value in params.items() if value is not None})
+        if query:
+            endpoint += "?" + query
         
-        result = self.client.get(endpoint)
-        if result is None:
-            return None
-        return [Breach.model_validate(item) for item in result]
+        return self._get_many(endpoint, Breach)
     
     def get_single_breach(self, name: str) -> Breach | None:
         """Get a single breach by name."""
-        result = self.client.get(f"/breach/{name}")
-        if result is None:
-            return None
-        return Breach.model_validate(result)
+        return self._get_one(f"/breach/{name}", Breach)
     
     def get_latest_breach(self) -> Breach | None:
         """Get the latest breach."""
-        result = self.client.get("/latestbreach")
-        if result is None:
-            return None
-        return Breach.model_validate(result)
+        return self._get_one("/latestbreach", Breach)
     
     def get_data_classes(self) -> list[str] | None:
         """Get all data classes."""
         return self.client.get("/dataclasses")
     
+    # Breach Catalogue Cache
+    
+    def get_breach_index(self, ttl: float = 3600) -> dict[str, Breach]:
+        """
+        Get all breaches keyed by name, served from a local cache while fresh.
+        
+        The catalogue changes at most daily, so it is fetched once and reused for
+        `ttl` seconds. With `breach_cache_path` set, the response is persisted to
+        disk and revalidated with If-None-Match / If-Modified-Since once stale.
+        
+        Args:
+            ttl: Maximum age of the cached catalogue in seconds
+        
+        Returns:
+            Dict mapping breach name to Breach
+        """
+        index = self._breach_catalogue.fresh_index(ttl)
+        if index is not None:
+            return index
+        
+        cached, headers = self._breach_catalogue.revalidation(ttl)
+        response = None if headers is None else self.client.get_response("/breaches", headers=headers)
+        return self._breach_catalogue.update(cached, response)
+    
+    def expand_breach_names(self, names: list[str]) -> list[Breach]:
+        """
+        Resolve breach names (e.g. from a truncated account lookup) to full Breach records.
+        
+        If a name is missing, the catalogue is refreshed (conditionally) unless it
+        was fetched within the last minute; names that are still unknown are skipped.
+        
+        Args:
+            names: Breach names to resolve
+        
+        Returns:
+            Breach records in the order of `names`
+        """
+        index = self.get_breach_index()
+        if any(name not in index for name in names):
+            index = self.get_breach_index(ttl=_MISSING_NAME_REFRESH_AGE)
+        return [index[name] for name in names if name in index]
+    
     # Stealer Logs Endpoints (Requires Pwned 5+ subscription)
     
     def get_stealer_logs_by_email(self, email: str) -> list[str] | None:
@@ -128,10 +387,7 @@ class ApiClient:
     
     def get_pastes_for_account(self, account: str) -> list[Paste] | None:
         """Get pastes for an account."""
-        result = self.client.get(f"/pasteaccount/{quote(account)}")
-        if result is None:
-            return None
-        return [Paste.model_validate(item) for item in result]
+        return self._get_many(f"/pasteaccount/{quote(account)}", Paste)
     
     # Subscription Endpoints
     
@@ -147,4 +403,29 @@ class ApiClient:
         # Pwned Passwords API returns plain text, not JSON
         if isinstance(result, str):
             return result
-        return None
\ No newline at end of file
+        return None
+    
+    def search_password_range_counts(self, hash_prefix: str) -> dict[str, int]:
+        """
+        Get hash suffix -> breach count for a hash prefix.
+        
+        Ranges rarely change, so each prefix's ETag is kept and the lookup is
+        revalidated with If-None-Match on repeat calls.
+        """
+        headers = self._range_cache.request_headers(hash_prefix)
+        response = self.pwned_passwords_client.get_response(f"/range/{hash_prefix}", headers=headers)
+        return self._range_cache.update(hash_prefix, response)
+    
+    def search_passwords_by_ranges(self, hash_prefixes: list[str]) -> dict[str, dict[str, int]]:
+        """
+        Look up many hash prefixes over the shared keep-alive session.
+        
+        Use AsyncApiClient.search_passwords_by_ranges to issue them concurrently.
+        
+        Args:
+            hash_prefixes: Hash prefixes (first 5 characters of SHA-1 or NTLM hashes)
+        
+        Returns:
+            Dict mapping each prefix to its hash suffix -> count map
+        """
+        return {prefix: self.search_password_range_counts(prefix) for prefix in hash_prefixes}
\ No newline at end of file
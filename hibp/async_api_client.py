@@ -0,0 +1,280 @@
+import asyncio
+from typing import Optional
+from urllib.parse import quote, urlencode
+from pydantic import BaseModel
+from .api_client import (
+    _LIST_ADAPTERS,
+    _MISSING_NAME_REFRESH_AGE,
+    _BreachCatalogue,
+    _RangeCache,
+)
+from .async_rest_client import AsyncRestClient
+from .rate_limiter import RateLimiter
+from .models import (
+    Breach,
+    BreachName,
+    Paste,
+    SubscribedDomain,
+    _CONSTRUCTORS,
+    _RAW_STRUCTS,
+    _construct_from_raw,
+)
+
+
+class AsyncApiClient:
+    """Have I Been Pwned asyncio API client wrapper."""
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        user_agent: str = "hibp-client",
+        validate: bool = False,
+        breach_cache_path: Optional[str] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Initialize the async API client.
+        
+        Args:
+            api_key: Optional API key for authenticated endpoints
+            user_agent: User agent string for requests
+            validate: Run full Pydantic validation on responses instead of
+                trusting the API schema and building models directly
+            breach_cache_path: Optional file used to persist the /breaches
+                catalogue between runs (revalidated with conditional GETs)
+            rate_limiter: Limiter for haveibeenpwned.com requests (defaults to
+                10 requests/second; match it to your subscription's rate limit)
+        """
+        self.validate = validate
+        self.breach_cache_path = breach_cache_path
+        self._breach_catalogue = _BreachCatalogue(breach_cache_path, validate)
+        self._range_cache = _RangeCache()
+        self.client = AsyncRestClient(
+            base_url="https://haveibeenpwned.com/api/v3",
+            api_key=api_key,
+            user_agent=user_agent,
+            rate_limiter=rate_limiter or RateLimiter()
+        )
+        # Pwned Passwords is not rate limited
+        self.pwned_passwords_client = AsyncRestClient(
+            base_url="https://api.pwnedpasswords.com",
+            user_agent=user_agent
+        )
+    
+    async def close(self):
+        """Close both underlying REST client sessions."""
+        await self.client.close()
+        await self.pwned_passwords_client.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    async def _get_one(self, endpoint: str, model: type[BaseModel]) -> BaseModel | None:
+        """Fetch a JSON object and build `model` from it."""
+        if self.validate:
+            return await self.client.get(endpoint, as_model=model)
+        
+        raw_type = _RAW_STRUCTS.get(model)
+        if raw_type is not None:
+            raw = await self.client.get_decoded(endpoint, raw_type)
+            return None if raw is None else _construct_from_raw(model, raw)
+        
+        result = await self.client.get(endpoint)
+        if result is None:
+            return None
+        return _CONSTRUCTORS[model](result)
+    
+    async def _get_many(self, endpoint: str, model: type[BaseModel]) -> list[BaseModel] | None:
+        """Fetch a JSON array and build a list of `model` from it."""
+        if self.validate:
+            return await self.client.get(endpoint, adapter=_LIST_ADAPTERS[model])
+        
+        raw_type = _RAW_STRUCTS.get(model)
+        if raw_type is not None:
+            raws = await self.client.get_decoded(endpoint, list[raw_type])
+            return None if raws is None else [_construct_from_raw(model, raw) for raw in raws]
+        
+        result = await self.client.get(endpoint)
+        if result is None:
+            return None
+        return list(map(_CONSTRUCTORS[model], result))
+    
+    # Breach Endpoints
+    
+    async def get_breaches_for_account(
+        self,
+        account: str,
+        truncate_response: bool = True,
+        domain: Optional[str] = None,
+        include_unverified: bool = True
+    ) -> list[BreachName | Breach] | None:
+        """Get breaches for an account."""
+        endpoint = f"/breachedaccount/{quote(account)}"
+        params = {
+            "truncateResponse": None if truncate_response else "false",
+            "domain": domain or None,
+            "includeUnverified": None if include_unverified else "false",
+        }
+        
+        query = urlencode({key: value for key, value in params.items() if value is not None})
+        if query:
+            endpoint += "?" + query
+        
+        model = BreachName if truncate_response else Breach
+        return await self._get_many(endpoint, model)
+    
+    async def get_breached_domain(self, domain: str) -> dict[str, list[str]] | None:
+        """Get breached accounts for a domain."""
+        result = await self.client.get(f"/breacheddomain/{domain}")
+        return result  # Returns dict with email aliases as keys, breach names as values
+    
+    async def get_subscribed_domains(self) -> list[SubscribedDomain] | None:
+        """Get subscribed domains."""
+        return await self._get_many("/subscribeddomains", SubscribedDomain)
+    
+    async def get_all_breaches(
+        self,
+        domain: Optional[str] = None,
+        is_spam_list: Optional[bool] = None
+    ) -> list[Breach] | None:
+        """Get all breaches."""
+        endpoint = "/breaches"
+        params = {
+            "Domain": domain or None,
+            "IsSpamList": None if is_spam_list is None else ("true" if is_spam_list else "false"),
+        }
+        
+        query = urlencode({key: value for key, value in params.items() if value is not None})
+        if query:
+            endpoint += "?" + query
+        
+        return await self._get_many(endpoint, Breach)
+    
+    async def get_single_breach(self, name: str) -> Breach | None:
+        """Get a single breach by name."""
+        return await self._get_one(f"/breach/{name}", Breach)
+    
+    async def get_latest_breach(self) -> Breach | None:
+        """Get the latest breach."""
+        return await self._get_one("/latestbreach", Breach)
+    
+    async def get_data_classes(self) -> list[str] | None:
+        """Get all data classes."""
+        return await self.client.get("/dataclasses")
+    
+    # Breach Catalogue Cache
+    
+    async def get_breach_index(self, ttl: float = 3600) -> dict[str, Breach]:
+        """
+        Get all breaches keyed by name, served from a local cache while fresh.
+        
+        The catalogue changes at most daily, so it is fetched once and reused for
+        `ttl` seconds. With `breach_cache_path` set, the response is persisted to
+        disk and revalidated with If-None-Match / If-Modified-Since once stale.
+        
+        Args:
+            ttl: Maximum age of the cached catalogue in seconds
+        
+        Returns:
+            Dict mapping breach name to Breach
+        """
+        index = self._breach_catalogue.fresh_index(ttl)
+        if index is not None:
+            return index
+        
+        cached, headers = self._breach_catalogue.revalidation(ttl)
+        response = None if headers is None else await self.client.get_response("/breaches", headers=headers)
+        return self._breach_catalogue.update(cached, response)
+    
+    async def expand_breach_names(self, names: list[str]) -> list[Breach]:
+        """
+        Resolve breach names (e.g. from a truncated account lookup) to full Breach records.
+        
+        If a name is missing, the catalogue is refreshed (conditionally) unless it
+        was fetched within the last minute; names that are still unknown are skipped.
+        
+        Args:
+            names: Breach names to resolve
+        
+        Returns:
+            Breach records in the order of `names`
+        """
+        index = await self.get_breach_index()
+        if any(name not in index for name in names):
+            index = await self.get_breach_index(ttl=_MISSING_NAME_REFRESH_AGE)
+        return [index[name] for name in names if name in index]
+    
+    # Stealer Logs Endpoints (Requires Pwned 5+ subscription)
+    
+    async def get_stealer_logs_by_email(self, email: str) -> list[str] | None:
+        """Get stealer log domains by email."""
+        return await self.client.get(f"/stealerlogsbyemail/{quote(email)}")
+    
+    async def get_stealer_logs_by_website_domain(self, domain: str) -> list[str] | None:
+        """Get stealer log emails by website domain."""
+        return await self.client.get(f"/stealerlogsbywebsitedomain/{domain}")
+    
+    async def get_stealer_logs_by_email_domain(self, domain: str) -> dict[str, list[str]] | None:
+        """Get stealer logs by email domain."""
+        result = await self.client.get(f"/stealerlogsbyemaildomain/{domain}")
+        return result  # Returns dict with email aliases as keys, website domains as values
+    
+    # Paste Endpoints
+    
+    async def get_pastes_for_account(self, account: str) -> list[Paste] | None:
+        """Get pastes for an account."""
+        return await self._get_many(f"/pasteaccount/{quote(account)}", Paste)
+    
+    # Subscription Endpoints
+    
+    async def get_subscription_status(self) -> dict | None:
+        """Get subscription status."""
+        return await self.client.get("/subscription/status")
+    
+    # Pwned Passwords Endpoints
+    
+    async def search_passwords_by_range(self, hash_prefix: str) -> str | None:
+        """Search passwords by hash range (first 5 characters of SHA-1 or NTLM hash)."""
+        result = await self.pwned_passwords_client.get(f"/range/{hash_prefix}")
+        # Pwned Passwords API returns plain text, not JSON
+        if isinstance(result, str):
+            return result
+        return None
+    
+    async def search_password_range_counts(self, hash_prefix: str) -> dict[str, int]:
+        """
+        Get hash suffix -> breach count for a hash prefix.
+        
+        Ranges rarely change, so each prefix's ETag is kept and the lookup is
+        revalidated with If-None-Match on repeat calls.
+        """
+        headers = self._range_cache.request_headers(hash_prefix)
+        response = await self.pwned_passwords_client.get_response(f"/range/{hash_prefix}", headers=headers)
+        return self._range_cache.update(hash_prefix, response)
+    
+    async def search_passwords_by_ranges(
+        self,
+        hash_prefixes: list[str],
+        max_concurrency: int = 20
+    ) -> dict[str, dict[str, int]]:
+        """
+        Look up many hash prefixes concurrently.
+        
+        Args:
+            hash_prefixes: Hash prefixes (first 5 characters of SHA-1 or NTLM hashes)
+            max_concurrency: Maximum number of in-flight requests
+        
+        Returns:
+            Dict mapping each prefix to its hash suffix -> count map
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def search(hash_prefix: str) -> dict[str, int]:
+            async with semaphore:
+                return await self.search_password_range_counts(hash_prefix)
+        
+        results = await asyncio.gather(*(search(prefix) for prefix in hash_prefixes))
+        return dict(zip(hash_prefixes, results))
\ No newline at end of file
@@ -0,0 +1,162 @@
+import httpx
+from typing import Any, Optional
+from pydantic import BaseModel, TypeAdapter
+from .rate_limiter import RateLimiter
+from .rest_client import ACCEPT_ENCODING, _json_loads
+
+try:
+    import msgspec
+except ImportError:  # msgspec is an optional speedup
+    msgspec = None
+
+
+class AsyncRestClient:
+    """An asyncio REST client wrapper around httpx for Have I Been Pwned API."""
+    
+    # Number of times a 429 response is retried after waiting out Retry-After
+    max_rate_limit_retries = 3
+    
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        user_agent: str = "hibp-client",
+        rate_limiter: Optional[RateLimiter] = None
+    ):
+        """
+        Initialize the async REST client.
+        
+        Args:
+            base_url: The base URL for the API (e.g., 'https://haveibeenpwned.com/api/v3')
+            api_key: Optional API key for authentication
+            user_agent: User agent string for the client
+            rate_limiter: Optional limiter every request waits on; 429 responses
+                are then retried after their Retry-After delay
+        """
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.user_agent = user_agent
+        self.rate_limiter = rate_limiter
+        
+        headers = {'user-agent': user_agent, 'accept-encoding': ACCEPT_ENCODING}
+        if api_key:
+            headers['hibp-api-key'] = api_key
+        
+        # HTTP/2 multiplexes concurrent requests to the same host over one connection
+        self.session = httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+        )
+    
+    async def _send(self, endpoint: str, headers: Optional[dict[str, str]] = None) -> httpx.Response:
+        """Send a GET request, pacing it through the rate limiter if one is set."""
+        url = f"{self.base_url}{endpoint}"
+        if self.rate_limiter is None:
+            return await self.session.get(url, headers=headers)
+        
+        for attempt in range(self.max_rate_limit_retries + 1):
+            async with self.rate_limiter:
+                response = await self.session.get(url, headers=headers)
+            if response.status_code != 429 or attempt == self.max_rate_limit_retries:
+                break
+            # Wait out Retry-After (the limiter holds back every caller) and try again
+            if self.rate_limiter.update_from_headers(response.headers) is None:
+                break
+        return response
+    
+    async def get(
+        self,
+        endpoint: str,
+        as_model: type[BaseModel] | None = None,
+        adapter: TypeAdapter | None = None
+    ) -> dict | list | str | BaseModel | None:
+        """
+        Perform a GET request to the specified endpoint.
+        
+        Args:
+            endpoint: The API endpoint (e.g., '/breachedaccount/test@example.com')
+            as_model: Validate the JSON body directly into this model
+            adapter: Validate the JSON body with this TypeAdapter (e.g. TypeAdapter(list[SomeModel]))
+        
+        Returns:
+            Parsed JSON data, plain text, validated model(s), or None if 404 status code
+        
+        Raises:
+            httpx.HTTPStatusError: For non-200/404 status codes
+        """
+        response = await self._send(endpoint)
+        
+        if response.status_code == 404:
+            return None
+        
+        response.raise_for_status()
+        
+        # Validate straight from the raw bytes without building an intermediate dict
+        if as_model is not None:
+            return as_model.model_validate_json(response.content)
+        if adapter is not None:
+            return adapter.validate_json(response.content)
+        
+        # Try to parse as JSON, fall back to plain text
+        try:
+            return _json_loads(response.content)
+        except ValueError:
+            return response.text
+    
+    async def get_response(self, endpoint: str, headers: Optional[dict[str, str]] = None) -> httpx.Response:
+        """
+        Perform a GET request and return the raw response.
+        
+        Used for conditional requests (If-None-Match / If-Modified-Since), so a
+        304 Not Modified response is returned rather than raised.
+        
+        Args:
+            endpoint: The API endpoint (e.g., '/breaches')
+            headers: Extra request headers
+        
+        Returns:
+            The response object
+        
+        Raises:
+            httpx.HTTPStatusError: For 4xx/5xx status codes
+        """
+        response = await self._send(endpoint, headers=headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+    
+    async def get_decoded(self, endpoint: str, type: Any) -> Any:
+        """
+        Perform a GET request and decode the JSON body with msgspec.
+        
+        Requires the optional msgspec dependency.
+        
+        Args:
+            endpoint: The API endpoint (e.g., '/breaches')
+            type: Target type for msgspec.json.decode (e.g., list[SomeStruct])
+        
+        Returns:
+            Decoded object of the requested type, or None if 404 status code
+        
+        Raises:
+            httpx.HTTPStatusError: For non-200/404 status codes
+        """
+        response = await self._send(endpoint)
+        
+        if response.status_code == 404:
+            return None
+        
+        response.raise_for_status()
+        return msgspec.json.decode(response.content, type=type)
+    
+    async def close(self):
+        """Close the underlying session and release pooled connections."""
+        await self.session.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -1,6 +1,11 @@
 from datetime import datetime, date
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Callable, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import msgspec
+except ImportError:  # msgspec is an optional speedup
+    msgspec = None
 
 
 class Breach(BaseModel):
@@ -25,8 +30,7 @@ class Breach(BaseModel):
     is_stealer_log: bool = Field(False, alias="IsStealerLog", description="Whether the breach is from stealer logs")
     is_subscription_free: bool = Field(..., alias="IsSubscriptionFree", description="Whether the breach is subscription free")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra='ignore')
 
 
 class BreachName(BaseModel):
@@ -34,8 +38,7 @@ class BreachName(BaseModel):
     
     name: str = Field(..., alias="Name", description="Name of the breach")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra='ignore')
 
 
 class Paste(BaseModel):
@@ -47,8 +50,7 @@ class Paste(BaseModel):
     date: Optional[datetime] = Field(None, alias="Date", description="Date the paste was posted")
     email_count: int = Field(..., alias="EmailCount", description="Number of emails found in the paste")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra='ignore')
 
 
 class BreachedDomain(BaseModel):
@@ -96,8 +98,7 @@ class SubscribedDomain(BaseModel):
         description="Date subscription ends"
     )
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra='ignore')
 
 
 class EmailCheckResult(BaseModel):
@@ -106,4 +107,97 @@ class EmailCheckResult(BaseModel):
     email: str = Field(..., description="Email address that was checked")
     status: str = Field(..., description="Status: 'ok' or 'error'")
     breaches: list[str] = Field(default_factory=list, description="List of breach names (empty if no breaches)")
-    error: Optional[str] = Field(None, description="Error message if status is 'error'")
\ No newline at end of file
+    error: Optional[str] = Field(None, description="Error message if status is 'error'")
+
+
+# Fast construction for trusted API responses
+#
+# The HIBP API has a stable schema, so responses can skip Pydantic validation:
+# keys are renamed from their PascalCase aliases, date fields are parsed
+# directly, and the model is built with model_construct.
+
+def _parse_datetime(value: str) -> datetime:
+    # datetime.fromisoformat only accepts a trailing 'Z' from Python 3.11
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+def _parse_optional_datetime(value: Optional[str]) -> Optional[datetime]:
+    return _parse_datetime(value) if value else None
+
+
+# PascalCase API key -> Breach field name
+_BREACH_RENAME = {field.alias: name for name, field in Breach.model_fields.items()}
+
+
+def _construct_breach(item: dict[str, Any]) -> Breach:
+    values = {_BREACH_RENAME.get(key, key): value for key, value in item.items()}
+    values["breach_date"] = date.fromisoformat(values["breach_date"])
+    values["added_date"] = _parse_datetime(values["added_date"])
+    values["modified_date"] = _parse_datetime(values["modified_date"])
+    return Breach.model_construct(**values)
+
+
+def _construct_breach_name(item: dict[str, Any]) -> BreachName:
+    return BreachName.model_construct(name=item["Name"])
+
+
+def _construct_paste(item: dict[str, Any]) -> Paste:
+    return Paste.model_construct(
+        source=item["Source"],
+        id=item["Id"],
+        title=item.get("Title"),
+        date=_parse_optional_datetime(item.get("Date")),
+        email_count=item["EmailCount"]
+    )
+
+
+def _construct_subscribed_domain(item: dict[str, Any]) -> SubscribedDomain:
+    return SubscribedDomain.model_construct(
+        domain_name=item["DomainName"],
+        pwn_count=item.get("PwnCount"),
+        pwn_count_excluding_spam_lists=item.get("PwnCountExcludingSpamLists"),
+        pwn_count_excluding_spam_lists_at_last_renewal=item.get(
+            "PwnCountExcludingSpamListsAtLastSubscriptionRenewal"
+        ),
+        next_subscription_renewal=_parse_optional_datetime(item.get("NextSubscriptionRenewal"))
+    )
+
+
+_CONSTRUCTORS: dict[type[BaseModel], Callable[[dict[str, Any]], BaseModel]] = {
+    Breach: _construct_breach,
+    BreachName: _construct_breach_name,
+    Paste: _construct_paste,
+    SubscribedDomain: _construct_subscribed_domain,
+}
+
+
+# msgspec mirrors of the response models
+#
+# When msgspec is installed, response bytes are decoded straight into these
+# structs (field renames and date parsing happen in C) and then turned into the
+# public Pydantic models with model_construct.
+
+def _raw_struct(model: type[BaseModel]) -> type:
+    """Build a msgspec.Struct with the same fields, types and JSON names as `model`."""
+    fields = []
+    rename = {}
+    for name, field in model.model_fields.items():
+        if field.is_required():
+            fields.append((name, field.annotation))
+        else:
+            fields.append((name, field.annotation, field.default))
+        if field.alias:
+            rename[name] = field.alias
+    return msgspec.defstruct(f"_{model.__name__}Raw", fields, kw_only=True, rename=rename)
+
+
+def _construct_from_raw(model: type[BaseModel], raw: Any) -> BaseModel:
+    """Turn a decoded msgspec struct into `model` without validation."""
+    return model.model_construct(**msgspec.structs.asdict(raw))
+
+
+_RAW_STRUCTS: dict[type[BaseModel], type] = (
+    {model: _raw_struct(model) for model in _CONSTRUCTORS} if msgspec is not None else {}
+)
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import time
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into seconds."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter for async API calls that honours Retry-After.
+    
+    Requests are spread out to `rate_per_sec`; when the API still answers 429,
+    update_from_headers() pauses every caller for the advertised Retry-After
+    delay instead of letting them burn retries.
+    
+    Usage:
+        async with limiter:
+            response = await session.get(url)
+    """
+    
+    def __init__(self, rate_per_sec: float = 10, burst: Optional[float] = None):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate_per_sec: Sustained number of requests allowed per second
+            burst: Maximum number of requests allowed back to back (defaults to
+                `rate_per_sec`, i.e. one second's worth)
+        
+        Raises:
+            ValueError: If `rate_per_sec` is not positive or `burst` is below 1
+        """
+        if rate_per_sec <= 0:
+            raise ValueError(f"rate_per_sec must be positive, got {rate_per_sec}")
+        if burst is not None and burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        
+        self.rate_per_sec = rate_per_sec
+        self.capacity = burst if burst is not None else max(1.0, rate_per_sec)
+        self.tokens = self.capacity
+        self._refilled_at = time.monotonic()
+        self._blocked_until = 0.0
+        # Waiters queue on the lock so tokens are handed out in arrival order
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a request may be sent and take a token for it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                
+                self.tokens = min(self.capacity, self.tokens + (now - self._refilled_at) * self.rate_per_sec)
+                self._refilled_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate_per_sec)
+    
+    def update_from_headers(self, headers: Mapping[str, str]) -> Optional[float]:
+        """
+        Pause all callers for the Retry-After delay of a 429 response.
+        
+        Args:
+            headers: Response headers (case-insensitive mapping)
+        
+        Returns:
+            The delay in seconds, or None if the response had no usable Retry-After
+        """
+        retry_after = headers.get('retry-after')
+        delay = _parse_retry_after(retry_after) if retry_after is not None else None
+        if delay is None:
+            return None
+        
+        logger.warning("Rate limited by the API; pausing requests for %.1fs", delay)
+        self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+        self.tokens = 0.0
+        return delay
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        pass
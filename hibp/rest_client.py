@@ -1,5 +1,30 @@
 import requests
-from typing import Optional
+from typing import Any, Optional
+from pydantic import BaseModel, TypeAdapter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is an optional speedup; stdlib json also accepts bytes
+    from json import loads as _json_loads
+
+try:
+    import msgspec
+except ImportError:  # msgspec is an optional speedup
+    msgspec = None
+
+# Prefer brotli (notably smaller than gzip on the HTML breach descriptions), but
+# only advertise it when a decoder is installed for requests/httpx to use
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'br, gzip'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'br, gzip'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip'
 
 
 class RestClient:
@@ -18,37 +43,119 @@ class RestClient:
         self.api_key = api_key
         self.user_agent = user_agent
     
-    def get(self, endpoint: str) -> dict | list | str | None:
+        # One keep-alive session per client so consecutive calls reuse the TCP+TLS connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        self.session.headers.update({'user-agent': user_agent, 'accept-encoding': ACCEPT_ENCODING})
+        if api_key:
+            self.session.headers['hibp-api-key'] = api_key
+    
+    def get(
+        self,
+        endpoint: str,
+        as_model: type[BaseModel] | None = None,
+        adapter: TypeAdapter | None = None
+    ) -> dict | list | str | BaseModel | None:
         """
         Perform a GET request to the specified endpoint.
         
         Args:
             endpoint: The API endpoint (e.g., '/breachedaccount/test@example.com')
+            as_model: Validate the JSON body directly into this model
+            adapter: Validate the JSON body with this TypeAdapter (e.g. TypeAdapter(list[SomeModel]))
         
         Returns:
-            Parsed JSON data, plain text, or None if 404 status code
+            Parsed JSON data, plain text, validated model(s), or None if 404 status code
         
         Raises:
             requests.HTTPError: For non-200/404 status codes
         """
         url = f"{self.base_url}{endpoint}"
         
-        headers = {
-            'user-agent': self.user_agent
-        }
-        
-        if self.api_key:
-            headers['hibp-api-key'] = self.api_key
-        
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url)
         
         if response.status_code == 404:
             return None
         
         response.raise_for_status()
         
+        # Validate straight from the raw bytes without building an intermediate dict
+        if as_model is not None:
+            return as_model.model_validate_json(response.content)
+        if adapter is not None:
+            return adapter.validate_json(response.content)
+        
         # Try to parse as JSON, fall back to plain text
         try:
-            return response.json()
+            return _json_loads(response.content)
         except ValueError:
-            return response.text
\ No newline at end of file
+            return response.text
+    
+    def get_response(self, endpoint: str, headers: Optional[dict[str, str]] = None) -> requests.Response:
+        """
+        Perform a GET request and return the raw response.
+        
+        Used for conditional requests (If-None-Match / If-Modified-Since), so a
+        304 Not Modified response is returned rather than raised.
+        
+        Args:
+            endpoint: The API endpoint (e.g., '/breaches')
+            headers: Extra request headers
+        
+        Returns:
+            The response object
+        
+        Raises:
+            requests.HTTPError: For 4xx/5xx status codes
+        """
+        response = self.session.get(f"{self.base_url}{endpoint}", headers=headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+    
+    def get_decoded(self, endpoint: str, type: Any) -> Any:
+        """
+        Perform a GET request and decode the JSON body with msgspec.
+        
+        Requires the optional msgspec dependency.
+        
+        Args:
+            endpoint: The API endpoint (e.g., '/breaches')
+            type: Target type for msgspec.json.decode (e.g., list[SomeStruct])
+        
+        Returns:
+            Decoded object of the requested type, or None if 404 status code
+        
+        Raises:
+            requests.HTTPError: For non-200/404 status codes
+        """
+        response = self.session.get(f"{self.base_url}{endpoint}")
+        
+        if response.status_code == 404:
+            return None
+        
+        response.raise_for_status()
+        return msgspec.json.decode(response.content, type=type)
+    
+    def close(self):
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
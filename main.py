@@ -7,17 +7,37 @@ to find which breaches they appear in.
 """
 
 import argparse
+import asyncio
+import mmap
 import os
 import re
+import stat
 import sys
-from typing import List
+from typing import Iterator, List
+import httpx
 from dotenv import load_dotenv
 
-from hibp.api_client import ApiClient
+from hibp.async_api_client import AsyncApiClient
 from hibp.models import BreachName, EmailCheckResult
+from hibp.rate_limiter import RateLimiter
 
 load_dotenv()
 
+# Maximum number of in-flight HIBP requests (one worker each)
+MAX_CONCURRENT_REQUESTS = 10
+
+# Requests per second sent to HIBP; match this to your subscription's rate limit
+RATE_LIMIT_PER_SEC = 10
+
+# Maximum number of scanned emails waiting for a worker
+QUEUE_SIZE = 1000
+
+# Number of checked emails whose progress lines are written to stdout at once
+OUTPUT_BATCH_SIZE = 100
+
+# Comprehensive email regex pattern, compiled once and matched against raw bytes
+_EMAIL_RE_BYTES = re.compile(rb'\b[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}\b')
+
 
 def parse_args():
     """Parse command line arguments."""
@@ -32,22 +52,7 @@ def parse_args():
     return parser.parse_args()
 
 
-def extract_emails_from_line(line: str) -> List[str]:
-    """
-    Extract email addresses from a line of text using regex.
-    
-    Args:
-        line: Line of text that may contain email addresses
-        
-    Returns:
-        List of email addresses found in the line
-    """
-    # Comprehensive email regex pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    return re.findall(email_pattern, line)
-
-
-def check_email_breaches(api_client: ApiClient, email: str) -> EmailCheckResult:
+async def check_email_breaches_async(api_client: AsyncApiClient, email: str) -> EmailCheckResult:
     """
     Check if an email appears in any breaches.
     
@@ -60,7 +65,7 @@ def check_email_breaches(api_client: ApiClient, email: str) -> EmailCheckResult:
     """
     try:
         # Get breaches for the account (truncated response for just names)
-        breaches = api_client.get_breaches_for_account(email, truncate_response=True)
+        breaches = await api_client.get_breaches_for_account(email, truncate_response=True)
         
         if breaches is None:
             return EmailCheckResult(
@@ -80,16 +85,25 @@ def check_email_breaches(api_client: ApiClient, email: str) -> EmailCheckResult:
         return EmailCheckResult(
             email=email,
             status='error',
-            error=str(e)
+            error=_error_message(e)
         )
 
 
+def _error_message(error: Exception) -> str:
+    """Describe a lookup failure in one line, as the output format requires."""
+    if isinstance(error, httpx.HTTPStatusError):
+        # str() of an httpx status error spans two lines (URL + MDN link)
+        return f"{error.response.status_code} {error.response.reason_phrase}"
+    lines = str(error).splitlines()
+    return lines[0] if lines else type(error).__name__
+
+
 def format_result(result: EmailCheckResult) -> str:
     """
     Format a result into the required output format.
     
     Args:
-        result: EmailCheckResult from check_email_breaches
+        result: EmailCheckResult from check_email_breaches_async
         
     Returns:
         Formatted string: "email:ok:breach1 breach2 ..." or "email:error:description"
@@ -104,8 +118,121 @@ def format_result(result: EmailCheckResult) -> str:
         return f"{result.email}:error:{result.error}"
 
 
-def main():
-    """Main function."""
+class InputFileError(Exception):
+    """Raised when the input file cannot be opened or scanned."""
+    
+    def __init__(self, path: str, error: OSError, results: List[EmailCheckResult]):
+        super().__init__(f"Could not read file '{path}': {error}")
+        self.results = results
+
+
+def iter_emails(path: str) -> Iterator[str]:
+    """
+    Extract email addresses from a file in a single regex pass over its contents.
+    
+    Regular files are memory-mapped and scanned as bytes, so they may contain
+    any mix of text; lines without emails are skipped implicitly. Pipes and
+    other non-regular files (e.g. /dev/stdin) are read into memory first.
+    
+    Args:
+        path: Path to a text file containing email addresses
+        
+    Yields:
+        Unique email addresses, in the order they first appear. Addresses are
+        compared case-insensitively (HIBP lookups are case-insensitive), keeping
+        the first spelling seen.
+    """
+    seen = set()
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        # Only non-empty regular files can be mapped; pipes, FIFOs and
+        # /dev/stdin report a size of 0 and are read in full instead
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                yield from _unique_emails(buf, seen)
+        else:
+            yield from _unique_emails(f.read(), seen)
+
+
+def _unique_emails(buf, seen: set[str]) -> Iterator[str]:
+    """Yield emails matched in `buf` whose lowercased form is not yet in `seen`."""
+    for match in _EMAIL_RE_BYTES.finditer(buf):
+        email = match.group().decode('ascii')
+        key = email.lower()
+        if key not in seen:
+            seen.add(key)
+            yield email
+
+
+async def check_all_emails(api_client: AsyncApiClient, path: str) -> List[EmailCheckResult]:
+    """
+    Check every email in a file, overlapping the file scan with API calls.
+    
+    A producer scans the file and feeds a bounded queue while
+    MAX_CONCURRENT_REQUESTS workers look the emails up.
+    
+    Args:
+        api_client: HIBP async API client instance
+        path: Path to a text file containing email addresses
+        
+    Returns:
+        EmailCheckResult for each unique email, in input order
+    
+    Raises:
+        InputFileError: If the file could not be opened or scanned; it carries
+            the results for the emails found before the failure
+    """
+    queue: asyncio.Queue[tuple[int, str] | None] = asyncio.Queue(maxsize=QUEUE_SIZE)
+    results: dict[int, EmailCheckResult] = {}
+    # Progress lines are batched into one write per OUTPUT_BATCH_SIZE emails
+    output: list[str] = []
+    scan_errors: list[OSError] = []
+    
+    def flush_output():
+        if output:
+            sys.stdout.write('\n'.join(output) + '\n')
+            output.clear()
+    
+    async def producer():
+        try:
+            for index, email in enumerate(iter_emails(path)):
+                await queue.put((index, email))
+                # put() only suspends on a full queue; yield so workers can
+                # start on this email while the rest of the file is scanned
+                await asyncio.sleep(0)
+        except OSError as e:
+            # Let the workers finish the emails already queued before reporting
+            scan_errors.append(e)
+        finally:
+            # One stop marker per worker, even if the file could not be read
+            for _ in range(MAX_CONCURRENT_REQUESTS):
+                await queue.put(None)
+    
+    async def worker():
+        while (item := await queue.get()) is not None:
+            index, email = item
+            result = await check_email_breaches_async(api_client, email)
+            results[index] = result
+            
+            output.append(f"Checking: {email}")
+            output.append(f"  Result: {format_result(result)}")
+            if len(output) >= 2 * OUTPUT_BATCH_SIZE:
+                flush_output()
+    
+    workers = [worker() for _ in range(MAX_CONCURRENT_REQUESTS)]
+    try:
+        await asyncio.gather(producer(), *workers)
+    finally:
+        flush_output()
+    
+    checked = [results[index] for index in range(len(results))]
+    if scan_errors:
+        raise InputFileError(path, scan_errors[0], checked)
+    return checked
+
+
+async def main_async():
+    """Main coroutine."""
     args = parse_args()
     
     # Get API key from environment
@@ -114,9 +241,6 @@ def main():
         print("Error: HIBP_API_KEY environment variable not set", file=sys.stderr)
         sys.exit(1)
     
-    # Initialize API client
-    api_client = ApiClient(api_key=api_key, user_agent="hibp-email-checker")
-    
     # Check if file exists
     if not os.path.exists(args.file):
         print(f"Error: File '{args.file}' not found", file=sys.stderr)
@@ -126,43 +250,27 @@ def main():
     print(f"Using API key: {'*' * (len(api_key) - 8) + api_key[-8:]}")
     print("-" * 60)
     
-    results = []
-    total_emails = 0
-    
+    exit_code = 0
     try:
-        with open(args.file, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Extract emails from this line
-                emails = extract_emails_from_line(line)
-                
-                if not emails:
-                    # Line contains no emails, skip silently
-                    continue
-                
-                # Check each email found in this line
-                for email in emails:
-                    total_emails += 1
-                    print(f"Checking: {email}")
-                    result = check_email_breaches(api_client, email)
-                    results.append(result)
-                    
-                    # Print immediate result
-                    print(f"  Result: {format_result(result)}")
-    
-    except FileNotFoundError:
-        print(f"Error: Could not read file '{args.file}'", file=sys.stderr)
-        sys.exit(1)
-    except UnicodeDecodeError as e:
-        print(f"Error: Could not decode file '{args.file}': {e}", file=sys.stderr)
-        sys.exit(1)
+        async with AsyncApiClient(
+            api_key=api_key,
+            user_agent="hibp-email-checker",
+            rate_limiter=RateLimiter(RATE_LIMIT_PER_SEC)
+        ) as api_client:
+            results = await check_all_emails(api_client, args.file)
+    except InputFileError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        if not e.results:
+            sys.exit(1)
+        # Still report the emails that were checked before the scan failed
+        results = e.results
+        exit_code = 1
     except Exception as e:
         print(f"Unexpected error: {e}", file=sys.stderr)
         sys.exit(1)
     
+    total_emails = len(results)
+    
     # Print summary
     print("-" * 60)
     print("SUMMARY:")
@@ -180,8 +288,16 @@ def main():
     
     # Final output in requested format
     print("\nFINAL RESULTS:")
-    for result in results:
-        print(format_result(result))
+    if results:
+        sys.stdout.write('\n'.join(map(format_result, results)) + '\n')
+    
+    if exit_code:
+        sys.exit(exit_code)
+
+
+def main():
+    """Main function."""
+    asyncio.run(main_async())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test cases for API client caching, using stubbed HTTP responses.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from hibp.api_client import ApiClient
+
+_BREACH = {
+    "Name": "Adobe",
+    "Title": "Adobe",
+    "Domain": "adobe.com",
+    "BreachDate": "2013-10-04",
+    "AddedDate": "2013-12-04T00:00:00Z",
+    "ModifiedDate": "2022-05-15T23:52:49Z",
+    "PwnCount": 152445165,
+    "Description": "In October 2013, 153 million Adobe accounts were breached.",
+    "LogoPath": "Adobe.png",
+    "DataClasses": ["Email addresses", "Passwords"],
+    "IsVerified": True,
+    "IsFabricated": False,
+    "IsSensitive": False,
+    "IsRetired": False,
+    "IsSpamList": False,
+    "IsMalware": False,
+    "IsStealerLog": False,
+    "IsSubscriptionFree": False
+}
+
+_BREACHES_BODY = json.dumps([_BREACH, dict(_BREACH, Name="Gawker")]).encode()
+
+
+def _response(status_code: int, content: bytes = b"", headers: dict[str, str] | None = None):
+    """Build a minimal stand-in for a requests.Response."""
+    return SimpleNamespace(status_code=status_code, content=content, headers=headers or {})
+
+
+class TestBreachCatalogueCache(unittest.TestCase):
+    """Test cases for the persisted /breaches catalogue."""
+    
+    def setUp(self):
+        """Set up a fresh cache file location."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "breaches.json")
+    
+    def _client(self, *responses):
+        """Create a client whose /breaches requests return `responses` in order."""
+        client = ApiClient(breach_cache_path=self.path)
+        self.addCleanup(client.close)
+        get_response = mock.patch.object(client.client, "get_response", side_effect=list(responses)).start()
+        self.addCleanup(mock.patch.stopall)
+        return client, get_response
+    
+    def test_fetch_then_revalidate(self):
+        """Test that a 200 is persisted and a later 304 reuses the stored body."""
+        client, get_response = self._client(
+            _response(200, _BREACHES_BODY, {"etag": '"v1"', "last-modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        )
+        self.assertEqual(list(client.get_breach_index()), ["Adobe", "Gawker"])
+        get_response.assert_called_once_with("/breaches", headers={})
+        
+        with open(self.path, encoding='utf-8') as f:
+            stored = json.load(f)
+        self.assertEqual(stored["etag"], '"v1"')
+        self.assertEqual(stored["body"], _BREACHES_BODY.decode())
+        
+        # A new client reads the fresh disk copy without a request...
+        client, get_response = self._client()
+        self.assertEqual(list(client.get_breach_index()), ["Adobe", "Gawker"])
+        get_response.assert_not_called()
+        
+        # ...and once stale revalidates it, keeping the body on 304 Not Modified
+        client, get_response = self._client(_response(304, headers={"etag": '"v1"'}))
+        self.assertEqual([b.domain for b in client.expand_breach_names(["Gawker"])], ["adobe.com"])
+        self.assertEqual(list(client.get_breach_index(ttl=0)), ["Adobe", "Gawker"])
+        get_response.assert_called_once_with("/breaches", headers={
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        })
+    
+    def test_corrupt_cache_file_is_ignored(self):
+        """Test that unreadable or wrongly shaped cache files are treated as no cache."""
+        for content in (b"\x80\x04not json", b"[1, 2]", b'{"etag": null, "body": "[]"}', b'{"body": 1, "fetched_at": 0}'):
+            with open(self.path, 'wb') as f:
+                f.write(content)
+            
+            client, get_response = self._client(_response(200, _BREACHES_BODY))
+            self.assertEqual(list(client.get_breach_index()), ["Adobe", "Gawker"])
+            get_response.assert_called_once_with("/breaches", headers={})
+
+    def test_unknown_names_do_not_refetch(self):
+        """Test that repeated unknown names reuse a recent catalogue and refresh conditionally."""
+        client = ApiClient()
+        self.addCleanup(client.close)
+        responses = [_response(200, _BREACHES_BODY, {"etag": '"v1"'}), _response(304, headers={"etag": '"v1"'})]
+        
+        with mock.patch.object(client.client, "get_response", side_effect=responses) as get_response:
+            for _ in range(3):
+                self.assertEqual([b.name for b in client.expand_breach_names(["Adobe", "NotInCatalogue"])], ["Adobe"])
+            get_response.assert_called_once_with("/breaches", headers={})
+            
+            # Without a cache file the in-memory validators still make refreshes conditional
+            self.assertEqual(list(client.get_breach_index(ttl=0)), ["Adobe", "Gawker"])
+            get_response.assert_called_with("/breaches", headers={"If-None-Match": '"v1"'})
+            self.assertEqual(get_response.call_count, 2)
+
+
+
+class TestPasswordRangeCache(unittest.TestCase):
+    """Test cases for ETag revalidation of Pwned Passwords range lookups."""
+    
+    def test_revalidates_with_etag(self):
+        """Test that a repeat lookup sends If-None-Match and reuses counts on 304."""
+        client = ApiClient()
+        self.addCleanup(client.close)
+        body = b"0018A45C4D1DEF81644B54AB7F969B88D65:1\r\n00D4F6E8FA6EECAD2A3AA415EEC418D38EC:2"
+        responses = [_response(200, body, {"etag": '"r1"'}), _response(304, headers={"etag": '"r1"'})]
+        
+        with mock.patch.object(client.pwned_passwords_client, "get_response", side_effect=responses) as get_response:
+            first = client.search_password_range_counts("21BD1")
+            second = client.search_password_range_counts("21BD1")
+        
+        self.assertEqual(first, {"0018A45C4D1DEF81644B54AB7F969B88D65": 1, "00D4F6E8FA6EECAD2A3AA415EEC418D38EC": 2})
+        self.assertEqual(second, first)
+        self.assertEqual(get_response.call_args_list, [
+            mock.call("/range/21BD1", headers=None),
+            mock.call("/range/21BD1", headers={"If-None-Match": '"r1"'}),
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
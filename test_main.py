@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Test cases for the email checker CLI helpers in main.py.
+"""
+
+import asyncio
+import io
+import os
+import re
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import httpx
+
+import main
+from hibp.async_api_client import AsyncApiClient
+from main import InputFileError, iter_emails
+
+# One FINAL RESULTS line: "email:ok:breach1 breach2 ..." or "email:error:description"
+_RESULT_LINE_RE = re.compile(r'[^\s:]+@[^\s:]+:(ok|error):.*')
+
+
+class TestIterEmails(unittest.TestCase):
+    """Test cases for extracting emails from input files."""
+    
+    _CONTENT = b"a@x.com some text\nB@Y.org, A@X.com\nno email here\nc@z.net\n"
+    _EXPECTED = ["a@x.com", "B@Y.org", "c@z.net"]
+    
+    def test_regular_file(self):
+        """Test scanning a memory-mapped regular file."""
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(self._CONTENT)
+        self.addCleanup(os.unlink, f.name)
+        
+        self.assertEqual(list(iter_emails(f.name)), self._EXPECTED)
+    
+    def test_empty_file(self):
+        """Test that an empty regular file yields nothing."""
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            pass
+        self.addCleanup(os.unlink, f.name)
+        
+        self.assertEqual(list(iter_emails(f.name)), [])
+    
+    def test_pipe(self):
+        """Test reading a non-regular file such as /dev/stdin or a FIFO."""
+        read_fd, write_fd = os.pipe()
+        
+        def feed():
+            with os.fdopen(write_fd, 'wb') as w:
+                w.write(self._CONTENT)
+        
+        writer = threading.Thread(target=feed)
+        writer.start()
+        try:
+            emails = list(iter_emails(f"/dev/fd/{read_fd}"))
+        finally:
+            writer.join()
+            os.close(read_fd)
+        
+        self.assertEqual(emails, self._EXPECTED)
+
+
+
+class _RecordingApiClient:
+    """Stand-in for AsyncApiClient that records when lookups start."""
+    
+    def __init__(self, events: list[str]):
+        self.events = events
+    
+    async def get_breaches_for_account(self, email, truncate_response=True):
+        self.events.append(f"request {email}")
+        return None
+
+
+class TestCheckAllEmails(unittest.TestCase):
+    """Test cases for the scan/lookup pipeline."""
+    
+    def test_lookups_start_before_scan_ends(self):
+        """Test that the first lookup is issued while the file is still being scanned."""
+        events: list[str] = []
+        
+        def recording_iter_emails(path):
+            for email in iter_emails(path):
+                events.append(f"scan {email}")
+                yield email
+        
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"a@x.com\nb@y.org\nc@z.net\n")
+        self.addCleanup(os.unlink, f.name)
+        
+        with mock.patch.object(main, "iter_emails", recording_iter_emails), redirect_stdout(io.StringIO()):
+            results = asyncio.run(main.check_all_emails(_RecordingApiClient(events), f.name))
+        
+        self.assertEqual([r.email for r in results], ["a@x.com", "b@y.org", "c@z.net"])
+        self.assertLess(events.index("request a@x.com"), events.index("scan c@z.net"))
+
+    def test_scan_error_keeps_checked_results(self):
+        """Test that a read error mid-scan still returns the emails checked so far."""
+        def failing_iter_emails(path):
+            yield "a@x.com"
+            yield "b@y.org"
+            raise OSError(5, "Input/output error")
+        
+        with mock.patch.object(main, "iter_emails", failing_iter_emails), redirect_stdout(io.StringIO()):
+            with self.assertRaises(InputFileError) as cm:
+                asyncio.run(main.check_all_emails(_RecordingApiClient([]), "emails.txt"))
+        
+        self.assertEqual([r.email for r in cm.exception.results], ["a@x.com", "b@y.org"])
+        self.assertIn("Could not read file 'emails.txt'", str(cm.exception))
+    
+    def test_output_errors_are_not_file_errors(self):
+        """Test that an OSError outside the input scan, e.g. a closed stdout, is not blamed on the file."""
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"a@x.com\n")
+        self.addCleanup(os.unlink, f.name)
+        
+        stderr = io.StringIO()
+        with (
+            mock.patch.object(main, "check_all_emails", side_effect=BrokenPipeError(32, "Broken pipe")),
+            mock.patch.dict(os.environ, {"HIBP_API_KEY": "0123456789abcdef"}),
+            mock.patch("sys.argv", ["main.py", "--file", f.name]),
+            redirect_stdout(io.StringIO()),
+            redirect_stderr(stderr),
+            self.assertRaises(SystemExit),
+        ):
+            asyncio.run(main.main_async())
+        
+        self.assertTrue(stderr.getvalue().startswith("Unexpected error:"), stderr.getvalue())
+    
+
+    def test_final_results_are_one_line_per_email(self):
+        """Test that HTTP errors are reported on the email's single output line."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            account = request.url.path.rsplit('/', 1)[1]
+            if account.startswith("clean"):
+                return httpx.Response(404)
+            if account.startswith("broken"):
+                return httpx.Response(500)
+            if account.startswith("limited"):
+                return httpx.Response(429)
+            return httpx.Response(200, json=[{"Name": "Adobe"}])
+        
+        def mock_client(**kwargs):
+            client = AsyncApiClient(**kwargs)
+            client.client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            return client
+        
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(b"a@x.com\nclean@y.org\nbroken@z.net\nlimited@w.io\n")
+        self.addCleanup(os.unlink, f.name)
+        
+        stdout = io.StringIO()
+        with (
+            mock.patch.object(main, "AsyncApiClient", mock_client),
+            mock.patch.dict(os.environ, {"HIBP_API_KEY": "0123456789abcdef"}),
+            mock.patch("sys.argv", ["main.py", "--file", f.name]),
+            redirect_stdout(stdout),
+        ):
+            asyncio.run(main.main_async())
+        
+        final = stdout.getvalue().split("FINAL RESULTS:\n", 1)[1].splitlines()
+        self.assertEqual(len(final), 4, final)
+        for line in final:
+            self.assertRegex(line, _RESULT_LINE_RE)
+        self.assertIn("broken@z.net:error:500 Internal Server Error", final)
+        self.assertIn("limited@w.io:error:429 Too Many Requests", final)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -3,8 +3,114 @@
 Test cases for HIBP API models based on sample responses from the API documentation.
 """
 
+import json
+import re
 import unittest
-from hibp.models import Breach, BreachName, Paste, EmailCheckResult
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Mapping
+from pydantic import TypeAdapter, ValidationError
+from hibp.api_client import _parse_range_response
+from hibp.models import (
+    Breach,
+    BreachName,
+    Paste,
+    EmailCheckResult,
+    _RAW_STRUCTS,
+    _construct_breach,
+    _construct_from_raw,
+    _construct_paste,
+    msgspec,
+)
+
+_BN_ADAPTER = TypeAdapter(list[BreachName])
+
+# One "HASHSUFFIX:COUNT" line of a Pwned Passwords range response
+_HIBP_LINE_RE = re.compile(rb'^([0-9A-F]+):(\d+)\r?$', re.MULTILINE)
+
+# Sample responses from the API documentation, built once and shared read-only.
+# The breaches are kept as the raw JSON body the API sends and parsed once.
+_BREACH_JSON: bytes = rb"""[
+    {
+        "Name": "Adobe",
+        "Title": "Adobe",
+        "Domain": "adobe.com",
+        "BreachDate": "2013-10-04",
+        "AddedDate": "2013-12-04T00:00:00Z",
+        "ModifiedDate": "2022-05-15T23:52:49Z",
+        "PwnCount": 152445165,
+        "Description": "In October 2013, 153 million Adobe accounts were breached with each containing an internal ID, username, email, <em>encrypted</em> password and a password hint in plain text. The password cryptography was poorly done and many were quickly resolved back to plain text. The unencrypted hints also <a href=\"http://www.troyhunt.com/2013/11/adobe-credentials-and-serious.html\" target=\"_blank\" rel=\"noopener\">disclosed much about the passwords</a> adding further to the risk that hundreds of millions of Adobe customers already faced.",
+        "LogoPath": "Adobe.png",
+        "DataClasses": [
+            "Email addresses",
+            "Password hints",
+            "Passwords",
+            "Usernames"
+        ],
+        "IsVerified": true,
+        "IsFabricated": false,
+        "IsSensitive": false,
+        "IsRetired": false,
+        "IsSpamList": false,
+        "IsMalware": false,
+        "IsStealerLog": false,
+        "IsSubscriptionFree": false
+    },
+    {
+        "Name": "BattlefieldHeroes",
+        "Title": "Battlefield Heroes",
+        "Domain": "battlefieldheroes.com",
+        "BreachDate": "2011-06-26",
+        "AddedDate": "2014-01-23T13:10:00Z",
+        "ModifiedDate": "2014-01-23T13:10:00Z",
+        "PwnCount": 530270,
+        "Description": "In June 2011 as part of a final breached data dump, the hacker collective \"LulzSec\" <a href=\"http://www.rockpapershotgun.com/2011/06/26/lulzsec-over-release-battlefield-heroes-data\" target=\"_blank\" rel=\"noopener\">obtained and released over half a million usernames and passwords from the game Battlefield Heroes</a>. The passwords were stored as MD5 hashes with no salt and many were easily converted back to their plain text versions.",
+        "DataClasses": [
+            "Passwords",
+            "Usernames"
+        ],
+        "IsVerified": true,
+        "IsFabricated": false,
+        "IsSensitive": false,
+        "IsRetired": false,
+        "IsSpamList": false,
+        "IsMalware": false,
+        "IsStealerLog": false,
+        "IsSubscriptionFree": false,
+        "LogoPath": "BattlefieldHeroes.png"
+    }
+]"""
+_BREACH_SAMPLES: tuple[Mapping[str, Any], ...] = tuple(map(MappingProxyType, json.loads(_BREACH_JSON)))
+
+_PASTE_SAMPLES: tuple[Mapping[str, Any], ...] = (
+    MappingProxyType({
+        "Source": "Pastebin",
+        "Id": "8Q0BvKD8", 
+        "Title": "syslog",
+        "Date": "2014-03-04T19:14:54Z",
+        "EmailCount": 139
+    }),
+    MappingProxyType({
+        "Source": "Pastie",
+        "Id": "7152479",
+        "Date": "2013-03-28T16:51:10Z", 
+        "EmailCount": 30
+        # Note: Title is missing in this sample (should be optional)
+    })
+)
+
+
+# Checker results shared by the EmailCheckResult tests, validated once at import
+_RESULT_OK, _RESULT_CLEAN, _RESULT_ERR = (
+    EmailCheckResult(email="test@example.com", status="ok", breaches=["Adobe", "LinkedIn"]),
+    EmailCheckResult(email="clean@example.com", status="ok"),
+    EmailCheckResult(email="invalid@example.com", status="error", error="Rate limit exceeded"),
+)
+
+
+def _all_str(xs) -> bool:
+    """Return True if every item of a non-empty sequence is exactly a str."""
+    return set(map(type, xs)) == {str}
 
 
 class TestBreachNameModel(unittest.TestCase):
@@ -18,126 +124,70 @@ class TestBreachNameModel(unittest.TestCase):
             {"Name": "Stratfor"}
         ]
         
-        for item in sample_data:
-            with self.subTest(breach_name=item["Name"]):
-                breach_name = BreachName.model_validate(item)
-                self.assertEqual(breach_name.name, item["Name"])
+        parsed = _BN_ADAPTER.validate_python(sample_data)
+        self.assertEqual([p.name for p in parsed], [item["Name"] for item in sample_data])
+    
+    def test_breach_name_is_frozen(self):
+        """Test that response models are immutable and ignore unknown fields."""
+        breach_name = BreachName.model_validate({"Name": "Adobe", "Unknown": 1})
+        self.assertFalse(hasattr(breach_name, "Unknown"))
+        with self.assertRaises(ValidationError):
+            breach_name.name = "Gawker"
 
 
 class TestBreachModel(unittest.TestCase):
     """Test cases for Breach model parsing."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.sample_data = [
-            {
-                "Name": "Adobe",
-                "Title": "Adobe",
-                "Domain": "adobe.com",
-                "BreachDate": "2013-10-04",
-                "AddedDate": "2013-12-04T00:00:00Z",
-                "ModifiedDate": "2022-05-15T23:52:49Z",
-                "PwnCount": 152445165,
-                "Description": "In October 2013, 153 million Adobe accounts were breached with each containing an internal ID, username, email, <em>encrypted</em> password and a password hint in plain text. The password cryptography was poorly done and many were quickly resolved back to plain text. The unencrypted hints also <a href=\"http://www.troyhunt.com/2013/11/adobe-credentials-and-serious.html\" target=\"_blank\" rel=\"noopener\">disclosed much about the passwords</a> adding further to the risk that hundreds of millions of Adobe customers already faced.",
-                "LogoPath": "Adobe.png",
-                "DataClasses": [
-                    "Email addresses",
-                    "Password hints", 
-                    "Passwords",
-                    "Usernames"
-                ],
-                "IsVerified": True,
-                "IsFabricated": False,
-                "IsSensitive": False,
-                "IsRetired": False,
-                "IsSpamList": False,
-                "IsMalware": False,
-                "IsStealerLog": False,
-                "IsSubscriptionFree": False
-            },
-            {
-                "Name": "BattlefieldHeroes",
-                "Title": "Battlefield Heroes",
-                "Domain": "battlefieldheroes.com", 
-                "BreachDate": "2011-06-26",
-                "AddedDate": "2014-01-23T13:10:00Z",
-                "ModifiedDate": "2014-01-23T13:10:00Z",
-                "PwnCount": 530270,
-                "Description": "In June 2011 as part of a final breached data dump, the hacker collective \"LulzSec\" <a href=\"http://www.rockpapershotgun.com/2011/06/26/lulzsec-over-release-battlefield-heroes-data\" target=\"_blank\" rel=\"noopener\">obtained and released over half a million usernames and passwords from the game Battlefield Heroes</a>. The passwords were stored as MD5 hashes with no salt and many were easily converted back to their plain text versions.",
-                "DataClasses": ["Passwords", "Usernames"],
-                "IsVerified": True,
-                "IsFabricated": False,
-                "IsSensitive": False,
-                "IsRetired": False,
-                "IsSpamList": False,
-                "IsMalware": False,
-                "IsStealerLog": False,
-                "IsSubscriptionFree": False,
-                "LogoPath": "BattlefieldHeroes.png"
-            }
-        ]
+    _BREACH_ADAPTER = TypeAdapter(list[Breach])
     
     def test_full_breach_parsing(self):
         """Test parsing full breach response with all fields."""
-        for item in self.sample_data:
-            with self.subTest(breach=item["Name"]):
-                breach = Breach.model_validate(item)
-                
-                # Verify key fields match
-                self.assertEqual(breach.name, item["Name"])
-                self.assertEqual(breach.title, item["Title"])
-                self.assertEqual(breach.domain, item["Domain"])
-                self.assertEqual(breach.pwn_count, item["PwnCount"])
-                self.assertEqual(breach.data_classes, item["DataClasses"])
-                self.assertEqual(breach.is_verified, item["IsVerified"])
-                
-                # Verify types
-                self.assertIsInstance(breach.pwn_count, int)
-                self.assertIsInstance(breach.data_classes, list)
-                self.assertIsInstance(breach.is_verified, bool)
+        breaches = self._BREACH_ADAPTER.validate_json(_BREACH_JSON)
+        
+        # Every field round-trips back to the API's JSON shape
+        self.assertEqual(
+            self._BREACH_ADAPTER.dump_python(breaches, by_alias=True, mode='json'),
+            list(map(dict, _BREACH_SAMPLES))
+        )
+    
+    def test_fast_construct_matches_validation(self):
+        """Test that trusted-response construction builds the same model as validation."""
+        self.assertEqual(
+            [_construct_breach(item) for item in _BREACH_SAMPLES],
+            self._BREACH_ADAPTER.validate_python(_BREACH_SAMPLES)
+        )
+    
+    @unittest.skipIf(msgspec is None, "msgspec is not installed")
+    def test_msgspec_decode_matches_validation(self):
+        """Test that msgspec decoding builds the same model as validation."""
+        raws = msgspec.json.decode(_BREACH_JSON, type=list[_RAW_STRUCTS[Breach]])
+        self.assertEqual(
+            [_construct_from_raw(Breach, raw) for raw in raws],
+            self._BREACH_ADAPTER.validate_python(_BREACH_SAMPLES)
+        )
 
 
 class TestPasteModel(unittest.TestCase):
     """Test cases for Paste model parsing."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.sample_data = [
-            {
-                "Source": "Pastebin",
-                "Id": "8Q0BvKD8", 
-                "Title": "syslog",
-                "Date": "2014-03-04T19:14:54Z",
-                "EmailCount": 139
-            },
-            {
-                "Source": "Pastie",
-                "Id": "7152479",
-                "Date": "2013-03-28T16:51:10Z", 
-                "EmailCount": 30
-                # Note: Title is missing in this sample (should be optional)
-            }
-        ]
+    _PASTE_ADAPTER = TypeAdapter(list[Paste])
     
     def test_paste_parsing(self):
         """Test parsing paste response."""
-        for item in self.sample_data:
-            with self.subTest(paste=item["Id"]):
-                paste = Paste.model_validate(item)
-                
-                # Verify key fields match
-                self.assertEqual(paste.source, item["Source"])
-                self.assertEqual(paste.id, item["Id"])
-                self.assertEqual(paste.email_count, item["EmailCount"])
-                
-                if "Title" in item:
-                    self.assertEqual(paste.title, item["Title"])
-                else:
-                    self.assertIsNone(paste.title)
-                
-                # Verify types
-                self.assertIsInstance(paste.email_count, int)
-                self.assertIsInstance(paste.source, str)
+        pastes = self._PASTE_ADAPTER.validate_python(_PASTE_SAMPLES)
+        
+        # Every field round-trips back to the API's JSON shape (Title is optional)
+        self.assertEqual(
+            self._PASTE_ADAPTER.dump_python(pastes, by_alias=True, mode='json', exclude_none=True),
+            list(map(dict, _PASTE_SAMPLES))
+        )
+    
+    def test_fast_construct_matches_validation(self):
+        """Test that trusted-response construction builds the same model as validation."""
+        self.assertEqual(
+            [_construct_paste(item) for item in _PASTE_SAMPLES],
+            self._PASTE_ADAPTER.validate_python(_PASTE_SAMPLES)
+        )
 
 
 class TestAPIResponseFormats(unittest.TestCase):
@@ -152,11 +202,9 @@ class TestAPIResponseFormats(unittest.TestCase):
         }
         
         # This should be handled as a dict[str, list[str]] in the API client
-        for alias, breaches in sample_data.items():
-            with self.subTest(alias=alias):
-                self.assertIsInstance(alias, str)
-                self.assertIsInstance(breaches, list)
-                self.assertTrue(all(isinstance(breach, str) for breach in breaches))
+        self.assertTrue(_all_str(sample_data))
+        self.assertEqual(set(map(type, sample_data.values())), {list})
+        self.assertTrue(_all_str(list(chain.from_iterable(sample_data.values()))))
 
 
     def test_stealer_logs_responses(self):
@@ -165,23 +213,21 @@ class TestAPIResponseFormats(unittest.TestCase):
         # Test stealer logs by email (returns list of domains)
         email_response = ["netflix.com", "spotify.com"]
         self.assertIsInstance(email_response, list)
-        self.assertTrue(all(isinstance(domain, str) for domain in email_response))
+        self.assertTrue(_all_str(email_response))
         
         # Test stealer logs by website domain (returns list of emails)
         website_response = ["andy@gmail.com", "jane@gmail.com"]
         self.assertIsInstance(website_response, list)
-        self.assertTrue(all(isinstance(email, str) for email in website_response))
+        self.assertTrue(_all_str(website_response))
         
         # Test stealer logs by email domain (returns dict of alias -> domains)
         email_domain_response = {
             "andy": ["netflix.com"],
             "jane": ["netflix.com", "spotify.com"]
         }
-        for alias, domains in email_domain_response.items():
-            with self.subTest(alias=alias):
-                self.assertIsInstance(alias, str)
-                self.assertIsInstance(domains, list)
-                self.assertTrue(all(isinstance(domain, str) for domain in domains))
+        self.assertTrue(_all_str(email_domain_response))
+        self.assertEqual(set(map(type, email_domain_response.values())), {list})
+        self.assertTrue(_all_str(list(chain.from_iterable(email_domain_response.values()))))
 
 
     def test_data_classes_response(self):
@@ -202,29 +248,33 @@ class TestAPIResponseFormats(unittest.TestCase):
         ]
         
         self.assertIsInstance(sample_data, list)
-        self.assertTrue(all(isinstance(data_class, str) for data_class in sample_data))
+        self.assertTrue(_all_str(sample_data))
         self.assertEqual(len(sample_data), 11)
 
 
     def test_pwned_passwords_response(self):
         """Test Pwned Passwords API response (plain text)."""
-        # This is what the Pwned Passwords API returns (plain text, not JSON)
-        sample_response = """00000005AD76BD555C1D6D771DE417A4B87E4B4:4
+        # This is what the Pwned Passwords API returns (plain text, not JSON),
+        # kept as the raw response bytes the client receives
+        sample_response = b"""00000005AD76BD555C1D6D771DE417A4B87E4B4:4
 00000008CD8B57AA7CA1D16D96A2C70C7C86BAB5:1
 0000000A0E6C5B6F7E8A8F4A1B0F1B0F1B0F1B0F:2"""
         
-        self.assertIsInstance(sample_response, str)
-        lines = sample_response.strip().split('\n')
-        self.assertEqual(len(lines), 3)
+        # Every line must be a hex hash suffix and a decimal count
+        matches = _HIBP_LINE_RE.findall(sample_response)
+        self.assertEqual([count for _, count in matches], [b"4", b"1", b"2"])
+    
+    def test_pwned_passwords_range_parsing(self):
+        """Test parsing a Pwned Passwords range response into suffix counts."""
+        sample_response = b"00000005AD76BD555C1D6D771DE417A4B87E4B4:4\r\n00000008CD8B57AA7CA1D16D96A2C70C7C86BAB5:1\r\n"
         
-        # Verify format of each line
-        for line in lines:
-            with self.subTest(line=line):
-                parts = line.split(':')
-                self.assertEqual(len(parts), 2)
-                hash_suffix, count = parts
-                self.assertTrue(len(hash_suffix) > 0)
-                self.assertTrue(count.isdigit())
+        self.assertEqual(_parse_range_response(sample_response), {
+            "00000005AD76BD555C1D6D771DE417A4B87E4B4": 4,
+            "00000008CD8B57AA7CA1D16D96A2C70C7C86BAB5": 1
+        })
+        self.assertEqual(_parse_range_response(b""), {})
+        # Blank lines are skipped without shifting the following entries
+        self.assertEqual(_parse_range_response(b"ABC:1\n\nDEF:2"), {"ABC": 1, "DEF": 2})
 
 
 class TestEmailCheckResult(unittest.TestCase):
@@ -232,11 +282,7 @@ class TestEmailCheckResult(unittest.TestCase):
     
     def test_result_with_breaches(self):
         """Test successful result with breaches."""
-        result = EmailCheckResult(
-            email="test@example.com",
-            status="ok", 
-            breaches=["Adobe", "LinkedIn"]
-        )
+        result = _RESULT_OK
         
         self.assertEqual(result.email, "test@example.com")
         self.assertEqual(result.status, "ok")
@@ -245,10 +291,7 @@ class TestEmailCheckResult(unittest.TestCase):
     
     def test_result_clean_email(self):
         """Test successful result with no breaches."""
-        result = EmailCheckResult(
-            email="clean@example.com",
-            status="ok"
-        )
+        result = _RESULT_CLEAN
         
         self.assertEqual(result.email, "clean@example.com")
         self.assertEqual(result.status, "ok")
@@ -257,11 +300,7 @@ class TestEmailCheckResult(unittest.TestCase):
     
     def test_result_with_error(self):
         """Test error result."""
-        result = EmailCheckResult(
-            email="invalid@example.com",
-            status="error",
-            error="Rate limit exceeded"
-        )
+        result = _RESULT_ERR
         
         self.assertEqual(result.email, "invalid@example.com")
         self.assertEqual(result.status, "error")
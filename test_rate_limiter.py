@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test cases for the Retry-After aware rate limiter and its use in AsyncRestClient.
+"""
+
+import time
+import unittest
+from email.utils import formatdate
+
+import httpx
+
+from hibp.async_rest_client import AsyncRestClient
+from hibp.rate_limiter import RateLimiter, _parse_retry_after
+
+
+class TestParseRetryAfter(unittest.TestCase):
+    """Test cases for Retry-After header parsing."""
+    
+    def test_seconds(self):
+        """Test delay-seconds values, clamping negatives to zero."""
+        self.assertEqual(_parse_retry_after("2"), 2.0)
+        self.assertEqual(_parse_retry_after("0.5"), 0.5)
+        self.assertEqual(_parse_retry_after("-3"), 0.0)
+    
+    def test_http_date(self):
+        """Test HTTP-date values in the future and in the past."""
+        delay = _parse_retry_after(formatdate(time.time() + 30, usegmt=True))
+        self.assertTrue(25 <= delay <= 31, delay)
+        self.assertEqual(_parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+    
+    def test_junk(self):
+        """Test that unparseable values are rejected."""
+        self.assertIsNone(_parse_retry_after("soon"))
+        self.assertIsNone(_parse_retry_after(""))
+
+
+class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the token bucket."""
+    
+    def test_rejects_invalid_rates(self):
+        """Test that non-positive rates and sub-1 bursts are rejected up front."""
+        for kwargs in ({"rate_per_sec": 0}, {"rate_per_sec": -1}, {"rate_per_sec": 5, "burst": 0.5}):
+            with self.assertRaises(ValueError):
+                RateLimiter(**kwargs)
+    
+    async def test_paces_after_burst(self):
+        """Test that requests beyond the burst are spread out to the configured rate."""
+        limiter = RateLimiter(rate_per_sec=20, burst=2)
+        start = time.monotonic()
+        for _ in range(4):
+            async with limiter:
+                pass
+        # Two requests go out immediately, the next two wait 1/20s each
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+    
+    async def test_update_from_headers_blocks_callers(self):
+        """Test that a Retry-After delay holds back the next acquire."""
+        limiter = RateLimiter(rate_per_sec=1000)
+        with self.assertLogs("hibp.rate_limiter", level="WARNING"):
+            self.assertEqual(limiter.update_from_headers({"retry-after": "0.1"}), 0.1)
+        self.assertIsNone(limiter.update_from_headers({}))
+        
+        start = time.monotonic()
+        await limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+
+class TestAsyncRestClientRateLimiting(unittest.IsolatedAsyncioTestCase):
+    """Test cases for 429 handling in AsyncRestClient."""
+    
+    async def _client(self, *responses: httpx.Response) -> tuple[AsyncRestClient, list[httpx.Request]]:
+        """Create a rate-limited client answered by `responses` in order."""
+        requests: list[httpx.Request] = []
+        pending = list(responses)
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return pending.pop(0)
+        
+        client = AsyncRestClient("https://example.test/api", rate_limiter=RateLimiter(rate_per_sec=1000))
+        await client.session.aclose()
+        client.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.addAsyncCleanup(client.close)
+        return client, requests
+    
+    async def test_retries_after_retry_after(self):
+        """Test that a 429 with Retry-After is waited out and retried."""
+        client, requests = await self._client(
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json=["Adobe"])
+        )
+        with self.assertLogs("hibp.rate_limiter", level="WARNING"):
+            self.assertEqual(await client.get("/breaches"), ["Adobe"])
+        self.assertEqual(len(requests), 2)
+    
+    async def test_429_without_retry_after_is_raised(self):
+        """Test that a 429 without Retry-After is not retried."""
+        client, requests = await self._client(httpx.Response(429))
+        with self.assertRaises(httpx.HTTPStatusError):
+            await client.get("/breaches")
+        self.assertEqual(len(requests), 1)
+    
+    async def test_retries_are_bounded(self):
+        """Test that retries stop after max_rate_limit_retries."""
+        attempts = AsyncRestClient.max_rate_limit_retries + 1
+        client, requests = await self._client(
+            *(httpx.Response(429, headers={"Retry-After": "0"}) for _ in range(attempts))
+        )
+        with self.assertLogs("hibp.rate_limiter", level="WARNING"), self.assertRaises(httpx.HTTPStatusError):
+            await client.get("/breaches")
+        self.assertEqual(len(requests), attempts)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)